@@ -6,6 +6,10 @@ DAON Bulk Protection Tool
 Protect large numbers of existing works at once.
 Perfect for creators migrating from unprotected platforms.
 
+Requirements:
+    Python 3.9+ and the packages in requirements.txt:
+    pip install -r requirements.txt
+
 Usage:
     python bulk-protection-script.py --source ao3_export.json
     python bulk-protection-script.py --source wordpress_export.xml
@@ -25,22 +29,98 @@ Features:
 """
 
 import argparse
-import json
-import xml.etree.ElementTree as ET
+import asyncio
 import os
 import sys
 import time
 import hashlib
-import re
-from pathlib import Path
-from typing import Dict, List, Optional, Any
-from dataclasses import dataclass
+import json
+import sqlite3
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from typing import Dict, Iterator, List, Optional, Set, Tuple, Any
+from dataclasses import dataclass, field
 from urllib.parse import urlparse
+import aiohttp
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+try:
+    # Prefer the C yajl backend; fall back to whichever ijson picks
+    import ijson.backends.yajl2_c as ijson
+except ImportError:
+    import ijson
+import soupsieve as sv
 from bs4 import BeautifulSoup
+from lxml import etree
+
+try:
+    # Optional speedup; the json fallback below produces equivalent compact JSON
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Content size bounds for a protectable work
+MIN_CONTENT_LENGTH = 100
+MAX_CONTENT_LENGTH = 10 * 1024 * 1024
+
+# URL scraping limits: total in-flight fetches, in-flight fetches per host,
+# and the pause each host slot holds after a fetch (polite per-domain rate).
+SCRAPE_CONCURRENCY = 20
+SCRAPE_PER_HOST_CONCURRENCY = 2
+SCRAPE_PER_HOST_DELAY = 1.0
+
+# Common content/author containers on scraped pages, compiled once
+CONTENT_SELECTORS = tuple(sv.compile(selector) for selector in (
+    'article',
+    '.post-content',
+    '.entry-content',
+    '.content',
+    'main',
+    '#content',
+    '.story-text',  # FanFiction.Net
+    '#workskin',    # AO3
+    '.userstuff'    # AO3
+))
+AUTHOR_SELECTORS = tuple(sv.compile(selector) for selector in (
+    '.author',
+    '.byline',
+    '[rel="author"]',
+    '.post-author'
+))
+
+# Protection API concurrency and request budget
+PROTECT_WORKERS = 16
+PROTECT_RATE_PER_SECOND = 10.0
+PROTECT_CONNECT_TIMEOUT = 3.05
+PROTECT_READ_TIMEOUT = 30
+
+# Where live runs record protected hashes, and how many inserts to batch per commit
+PROTECTED_DB_PATH = os.path.join(os.path.expanduser('~'), '.daon', 'protected.db')
+LEDGER_COMMIT_EVERY = 500
+
+# Works per /protect/bulk request (the API accepts at most 100)
+BULK_BATCH_SIZE = 50
+
+# Serialized bytes per /protect/bulk request, kept under the API's 10 MB JSON body limit
+BULK_MAX_BYTES = 9 * 1024 * 1024
+
+# File types picked up when protecting a directory
+TEXT_FILE_EXTENSIONS = ('.txt', '.md')
+
+# Files handed to each parser process per batch when reading directories
+FILE_PARSE_CHUNKSIZE = 32
 
+# Namespace-qualified WordPress WXR tags, resolved once for every item lookup
+# (the wp: namespace URI varies with the WXR version, so it is read per export)
+ITEM_TAG = 'item'
+CONTENT_ENCODED = '{http://purl.org/rss/1.0/modules/content/}encoded'
+DC_CREATOR = '{http://purl.org/dc/elements/1.1/}creator'
 
-@dataclass
+
+# Slotted instances (no per-work __dict__) need Python 3.10+
+@dataclass(**({'slots': True} if sys.version_info >= (3, 10) else {}))
 class Work:
     """Represents a creative work to be protected."""
     title: str
@@ -48,12 +128,13 @@ class Work:
     author: Optional[str] = None
     url: Optional[str] = None
     published_date: Optional[str] = None
-    tags: List[str] = None
-    fandoms: List[str] = None
-    characters: List[str] = None
+    tags: List[str] = field(default_factory=list)
+    fandoms: List[str] = field(default_factory=list)
+    characters: List[str] = field(default_factory=list)
     word_count: Optional[int] = None
     source_platform: Optional[str] = None
     original_id: Optional[str] = None
+    _content_hash: Optional[str] = field(default=None, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         if self.tags is None:
@@ -63,19 +144,194 @@ class Work:
         if self.characters is None:
             self.characters = []
         if self.word_count is None:
-            self.word_count = len(self.content.split())
+            # Only pay for the split on content that can pass validation
+            if MIN_CONTENT_LENGTH <= len(self.content) <= MAX_CONTENT_LENGTH:
+                self.word_count = len(self.content.split())
+            else:
+                self.word_count = 0
+    
+    def content_hash(self) -> str:
+        """SHA-256 hex digest of the content, computed once and cached."""
+        if self._content_hash is None:
+            self._content_hash = hashlib.sha256(self.content.encode('utf-8')).hexdigest()
+        return self._content_hash
+
+
+def dump_json(data: Any) -> bytes:
+    """Serialize data to compact UTF-8 JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
+
+def load_json(data: bytes) -> Any:
+    """Parse a JSON response body, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def wxr_tags(wp_ns: Optional[str]) -> Dict[str, str]:
+    """Qualified wp: tag names for an export; unqualified if it declares no wp namespace."""
+    prefix = f'{{{wp_ns}}}' if wp_ns else ''
+    return {name: prefix + name for name in ('post_type', 'status', 'post_id')}
+
+
+def iter_text_files(root: str) -> Iterator[str]:
+    """Yield paths of .txt/.md files under root in a single scandir walk."""
+    try:
+        with os.scandir(root) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from iter_text_files(entry.path)
+                elif entry.name.endswith(TEXT_FILE_EXTENSIONS) and entry.is_file():
+                    yield entry.path
+    except OSError as e:
+        print(f"❌ Error reading {root}: {e}")
+
+
+def parse_text_file(file_path: str) -> Optional[Dict[str, Any]]:
+    """Read one text file into plain Work fields (runs in a worker process)."""
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            content = f.read()
+        
+        # Try to extract title from first line or filename
+        lines = content.split('\n')
+        title = lines[0].strip() if lines and len(lines[0].strip()) < 100 else os.path.splitext(os.path.basename(file_path))[0]
+        
+        # Remove title from content if it was first line
+        if lines and lines[0].strip() == title:
+            content = '\n'.join(lines[1:]).strip()
+        
+        # Hash here too, so the parent process never re-encodes the content
+        in_bounds = MIN_CONTENT_LENGTH <= len(content) <= MAX_CONTENT_LENGTH
+        
+        return {
+            'title': title,
+            'content': content,
+            'word_count': len(content.split()) if in_bounds else 0,
+            'content_hash': hashlib.sha256(content.encode('utf-8')).hexdigest() if in_bounds else None,
+            'original_id': file_path
+        }
+        
+    except Exception as e:
+        print(f"❌ Error reading {file_path}: {e}")
+        return None
+
+
+class BulkEndpointUnavailable(Exception):
+    """Raised when the DAON API does not expose the bulk protect endpoint."""
+
+
+class BulkBatchTooLarge(Exception):
+    """Raised when the DAON API rejects a bulk request body as too large."""
+
+
+class ProtectionLedger:
+    """SQLite record of content hashes already protected, used to resume runs.
+    
+    Hashes are recorded per API URL, so protecting against a test server
+    never suppresses protection against another API.
+    """
+    
+    def __init__(self, path: str, api_url: str, commit_every: int = LEDGER_COMMIT_EVERY):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.execute(
+            'CREATE TABLE IF NOT EXISTS protected ('
+            'api_url TEXT, h TEXT, tx_hash TEXT, protected_at INTEGER, '
+            'PRIMARY KEY (api_url, h))'
+        )
+        self.api_url = api_url.rstrip('/')
+        self.commit_every = commit_every
+        self.pending = 0
+    
+    def hashes(self) -> Set[str]:
+        """Return every content hash recorded so far for this API."""
+        return {row[0] for row in self.conn.execute(
+            'SELECT h FROM protected WHERE api_url = ?', (self.api_url,)
+        )}
+    
+    def add(self, content_hash: str, tx_hash: Optional[str] = None):
+        """Record a protected hash, committing in batches."""
+        self.conn.execute(
+            'INSERT OR REPLACE INTO protected (api_url, h, tx_hash, protected_at) VALUES (?, ?, ?, ?)',
+            (self.api_url, content_hash, tx_hash, int(time.time()))
+        )
+        self.pending += 1
+        if self.pending >= self.commit_every:
+            self.commit()
+    
+    def commit(self):
+        """Flush pending inserts to disk."""
+        self.conn.commit()
+        self.pending = 0
+
+
+class TokenBucket:
+    """Thread-safe token bucket allowing `rate` acquisitions per second."""
+    
+    def __init__(self, rate: float, capacity: Optional[int] = None):
+        self.rate = rate
+        self.capacity = capacity or max(1, int(rate))
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def acquire(self):
+        """Block until a token is available, then consume it."""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                
+                wait = (1 - self.tokens) / self.rate
+            
+            time.sleep(wait)
 
 
 class BulkProtectionTool:
     """Tool for bulk protecting existing creative works."""
     
-    def __init__(self, api_url: str = "https://api.daon.network", dry_run: bool = False):
+    def __init__(self, api_url: str = "https://api.daon.network", dry_run: bool = False,
+                 use_bulk: bool = False):
         self.api_url = api_url
         self.dry_run = dry_run
+        self.use_bulk = use_bulk
         self.protected_count = 0
         self.error_count = 0
         self.skipped_count = 0
         self.results: List[Dict[str, Any]] = []
+        self.rate_limiter = TokenBucket(PROTECT_RATE_PER_SECOND)
+        self.bulk_supported = True
+        self.seen_hashes: Set[str] = set()
+        self.duplicates: Dict[str, List[Work]] = {}
+        self.ledger: Optional[ProtectionLedger] = None
+        
+        # Keep-alive connection pool shared by all protection workers
+        retries = Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=None
+        )
+        adapter = HTTPAdapter(
+            pool_connections=PROTECT_WORKERS,
+            pool_maxsize=PROTECT_WORKERS,
+            max_retries=retries
+        )
+        self.session = requests.Session()
+        self.session.headers.update({'User-Agent': 'DAON-Bulk-Protection-Tool/1.0'})
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         
     def protect_from_source(self, source_path: str, license_type: str = "liberation_v1"):
         """Main entry point - detect source type and process accordingly."""
@@ -117,27 +373,37 @@ class BulkProtectionTool:
         self.show_summary()
     
     def parse_ao3_export(self, file_path: str) -> List[Work]:
-        """Parse AO3 data export JSON."""
-        print(f"📖 Parsing AO3 export: {file_path}")
+        """Parse AO3 data export JSON.
         
+        A file that fails to read or parse part way through yields no works,
+        rather than whichever works were streamed before the error.
+        """
+        print(f"📖 Parsing AO3 export: {file_path}")
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            works = []
-            
+            return list(self.iter_ao3_export(file_path))
+        except Exception as e:
+            print(f"❌ Error reading AO3 export: {e}")
+            return []
+    
+    def iter_ao3_export(self, file_path: str) -> Iterator[Work]:
+        """Stream valid works from an AO3 export one at a time.
+        
+        Raises if the file cannot be read or is not valid JSON.
+        """
+        with open(file_path, 'rb') as f:
             # Handle different AO3 export formats
-            if isinstance(data, list):
+            shape = self.peek_json_shape(f)
+            if shape == b'[':
                 # Direct list of works
-                work_list = data
-            elif 'works' in data:
+                prefix = 'item'
+            elif shape == b'{' and self.has_works_key(f):
                 # Wrapped in works key
-                work_list = data['works']
+                prefix = 'works.item'
             else:
                 print("❌ Unrecognized AO3 export format")
-                return []
+                return
             
-            for work_data in work_list:
+            for work_data in ijson.items(f, prefix, use_float=True):
                 try:
                     work = Work(
                         title=work_data.get('title', 'Untitled'),
@@ -153,61 +419,82 @@ class BulkProtectionTool:
                     )
                     
                     if self.is_valid_work(work):
-                        works.append(work)
+                        yield work
                     else:
                         print(f"⚠️ Skipping invalid work: {work.title}")
                         
                 except Exception as e:
                     print(f"❌ Error parsing work: {e}")
                     continue
-            
-            return works
-            
-        except Exception as e:
-            print(f"❌ Error reading AO3 export: {e}")
-            return []
+    
+    @staticmethod
+    def has_works_key(f) -> bool:
+        """Return whether a JSON object file has a top-level "works" key, and rewind it."""
+        found = any(
+            prefix == '' and event == 'map_key' and value == 'works'
+            for prefix, event, value in ijson.parse(f)
+        )
+        f.seek(0)
+        return found
+    
+    @staticmethod
+    def peek_json_shape(f) -> bytes:
+        """Return the first non-whitespace byte of a JSON file and rewind it."""
+        shape = f.read(1)
+        while shape and shape.isspace():
+            shape = f.read(1)
+        f.seek(0)
+        return shape
     
     def parse_wordpress_export(self, file_path: str) -> List[Work]:
         """Parse WordPress WXR export file."""
         print(f"📝 Parsing WordPress export: {file_path}")
         
         try:
-            tree = ET.parse(file_path)
-            root = tree.getroot()
-            
-            # Find namespace
-            ns = {'wp': 'http://wordpress.org/export/1.2/'}
-            if not root.findall('.//wp:post_type', ns):
-                # Try without namespace for older exports
-                ns = {}
+            # Stream items one at a time instead of loading the whole WXR DOM;
+            # the wp namespace is taken from its declaration in the same pass.
+            # Entities are never expanded, so a crafted export cannot pull
+            # local files into post content that then gets submitted
+            context = etree.iterparse(file_path, events=('start-ns', 'end'), tag=ITEM_TAG, huge_tree=True,
+                                      resolve_entities=False, no_network=True)
+            wp = wxr_tags(None)
             
             works = []
             
-            for item in root.findall('.//item'):
+            for event, item in context:
+                if event == 'start-ns':
+                    prefix, uri = item
+                    if prefix == 'wp':
+                        wp = wxr_tags(uri)
+                    continue
+                
                 try:
                     # Skip non-post items
-                    post_type = item.find('wp:post_type', ns)
+                    post_type = item.find(wp['post_type'])
                     if post_type is not None and post_type.text not in ['post', 'page']:
                         continue
                     
                     # Skip non-published posts
-                    status = item.find('wp:status', ns)
+                    status = item.find(wp['status'])
                     if status is not None and status.text != 'publish':
                         continue
                     
                     title = item.find('title').text or 'Untitled'
-                    content_elem = item.find('content:encoded', {'content': 'http://purl.org/rss/1.0/modules/content/'})
+                    content_elem = item.find(CONTENT_ENCODED)
                     content = content_elem.text if content_elem is not None else ''
                     
-                    # Clean HTML from content
+                    # Clean HTML from content. WXR text is hashed as-is, so keep
+                    # html.parser: lxml's get_text() differs around block-editor
+                    # comments and leading whitespace, which would re-hash posts
                     if content:
                         soup = BeautifulSoup(content, 'html.parser')
                         content = soup.get_text()
                     
                     # Extract metadata
-                    author = item.find('dc:creator', {'dc': 'http://purl.org/dc/elements/1.1/'})
+                    author = item.find(DC_CREATOR)
                     pub_date = item.find('pubDate')
                     link = item.find('link')
+                    post_id = item.find(wp['post_id'])
                     
                     # Extract categories/tags
                     categories = []
@@ -227,7 +514,7 @@ class BulkProtectionTool:
                         published_date=pub_date.text if pub_date is not None else None,
                         tags=tags + categories,
                         source_platform='wordpress',
-                        original_id=item.find('wp:post_id', ns).text if item.find('wp:post_id', ns) is not None else None
+                        original_id=post_id.text if post_id is not None else None
                     )
                     
                     if self.is_valid_work(work):
@@ -236,6 +523,11 @@ class BulkProtectionTool:
                 except Exception as e:
                     print(f"❌ Error parsing WordPress item: {e}")
                     continue
+                finally:
+                    # Free the processed item and any siblings already seen
+                    item.clear()
+                    while item.getprevious() is not None:
+                        del item.getparent()[0]
             
             return works
             
@@ -251,23 +543,17 @@ class BulkProtectionTool:
             with open(file_path, 'r', encoding='utf-8') as f:
                 urls = [line.strip() for line in f if line.strip() and not line.startswith('#')]
             
+            results = asyncio.run(self.scrape_urls(urls))
+            
             works = []
             
-            for url in urls:
-                print(f"  📄 Fetching: {url}")
-                try:
-                    work = self.scrape_url(url)
-                    if work and self.is_valid_work(work):
-                        works.append(work)
-                    else:
-                        print(f"    ❌ Could not extract content")
-                        
-                except Exception as e:
-                    print(f"    ❌ Error: {e}")
-                    continue
-                
-                # Rate limiting for scraping
-                time.sleep(1)
+            for url, result in zip(urls, results):
+                if isinstance(result, Exception):
+                    print(f"    ❌ Error: {result}")
+                elif result and self.is_valid_work(result):
+                    works.append(result)
+                else:
+                    print(f"    ❌ Could not extract content: {url}")
             
             return works
             
@@ -275,112 +561,139 @@ class BulkProtectionTool:
             print(f"❌ Error reading URL list: {e}")
             return []
     
+    async def scrape_urls(self, urls: List[str]) -> List[Any]:
+        """Scrape URLs concurrently, rate limited per host.
+        
+        Returns one entry per URL, in order: a Work, None, or the exception raised.
+        """
+        limit = asyncio.Semaphore(SCRAPE_CONCURRENCY)
+        host_limits: Dict[str, asyncio.Semaphore] = {}
+        
+        async def bounded(session: aiohttp.ClientSession, url: str) -> Optional[Work]:
+            host = urlparse(url).netloc
+            if host not in host_limits:
+                host_limits[host] = asyncio.Semaphore(SCRAPE_PER_HOST_CONCURRENCY)
+            
+            # Take the host slot first, so URLs queued for a busy host never
+            # hold global slots that other hosts could be using
+            async with host_limits[host]:
+                try:
+                    async with limit:
+                        print(f"  📄 Fetching: {url}")
+                        return await self.scrape_url(session, url)
+                finally:
+                    # Rate limiting for scraping (held per host, not globally)
+                    await asyncio.sleep(SCRAPE_PER_HOST_DELAY)
+        
+        headers = {
+            'User-Agent': 'DAON Bulk Protection Tool 1.0'
+        }
+        
+        async with aiohttp.ClientSession(headers=headers) as session:
+            tasks = [bounded(session, url) for url in urls]
+            return await asyncio.gather(*tasks, return_exceptions=True)
+    
     def parse_file_directory(self, dir_path: str) -> List[Work]:
         """Parse directory of text files."""
         print(f"📁 Parsing directory: {dir_path}")
         
         works = []
         
-        text_files = list(Path(dir_path).glob('**/*.txt')) + list(Path(dir_path).glob('**/*.md'))
+        text_files = iter_text_files(dir_path)
         
-        for file_path in text_files:
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                
-                # Try to extract title from first line or filename
-                lines = content.split('\n')
-                title = lines[0].strip() if lines and len(lines[0].strip()) < 100 else file_path.stem
-                
-                # Remove title from content if it was first line
-                if lines and lines[0].strip() == title:
-                    content = '\n'.join(lines[1:]).strip()
+        # Decode and word-count files across cores; Works are rebuilt here
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            for parsed in executor.map(parse_text_file, text_files, chunksize=FILE_PARSE_CHUNKSIZE):
+                if parsed is None:
+                    continue
                 
                 work = Work(
-                    title=title,
-                    content=content,
+                    title=parsed['title'],
+                    content=parsed['content'],
+                    word_count=parsed['word_count'],
                     source_platform='file',
-                    original_id=str(file_path)
+                    original_id=parsed['original_id']
                 )
+                work._content_hash = parsed['content_hash']
                 
                 if self.is_valid_work(work):
                     works.append(work)
-                    
-            except Exception as e:
-                print(f"❌ Error reading {file_path}: {e}")
-                continue
         
         return works
     
-    def scrape_url(self, url: str) -> Optional[Work]:
+    async def scrape_url(self, session: aiohttp.ClientSession, url: str) -> Optional[Work]:
         """Scrape content from a URL."""
         try:
-            headers = {
-                'User-Agent': 'DAON Bulk Protection Tool 1.0'
-            }
+            async with session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
+                response.raise_for_status()
+                body = await response.read()
             
-            response = requests.get(url, headers=headers, timeout=10)
-            response.raise_for_status()
-            
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Extract title
-            title_elem = soup.find('title')
-            title = title_elem.text.strip() if title_elem else 'Untitled'
-            
-            # Extract content - try common content selectors
-            content_selectors = [
-                'article',
-                '.post-content',
-                '.entry-content', 
-                '.content',
-                'main',
-                '#content',
-                '.story-text',  # FanFiction.Net
-                '#workskin',    # AO3
-                '.userstuff'    # AO3
-            ]
-            
-            content = ''
-            for selector in content_selectors:
-                content_elem = soup.select_one(selector)
-                if content_elem:
-                    content = content_elem.get_text()
-                    break
-            
-            # Fallback to body text
-            if not content:
-                content = soup.get_text()
-            
-            # Clean up content
-            content = re.sub(r'\s+', ' ', content).strip()
-            
-            # Extract author if possible
-            author_selectors = [
-                '.author',
-                '.byline', 
-                '[rel="author"]',
-                '.post-author'
-            ]
-            
-            author = None
-            for selector in author_selectors:
-                author_elem = soup.select_one(selector)
-                if author_elem:
-                    author = author_elem.get_text().strip()
-                    break
-            
-            return Work(
-                title=title,
-                content=content,
-                author=author,
-                url=url,
-                source_platform=urlparse(url).netloc
-            )
+            # Parse off the event loop so other fetches keep progressing
+            return await asyncio.to_thread(self.parse_page, url, body)
             
         except Exception as e:
             raise Exception(f"Failed to scrape {url}: {e}")
     
+    def parse_page(self, url: str, body: bytes) -> Optional[Work]:
+        """Extract a Work from a fetched HTML page."""
+        soup = BeautifulSoup(body, 'lxml')
+        
+        # Extract title
+        title_elem = soup.find('title')
+        title = title_elem.text.strip() if title_elem else 'Untitled'
+        
+        # Extract content - try common content selectors
+        content = ''
+        for selector in CONTENT_SELECTORS:
+            content_elem = selector.select_one(soup)
+            if content_elem:
+                content = self.bounded_text(content_elem)
+                break
+        
+        # Fallback to body text
+        if not content:
+            content = self.bounded_text(soup)
+        
+        # Clean up content
+        content = ' '.join(content.split())
+        
+        # Extract author if possible
+        author = None
+        for selector in AUTHOR_SELECTORS:
+            author_elem = selector.select_one(soup)
+            if author_elem:
+                author = author_elem.get_text().strip()
+                break
+        
+        return Work(
+            title=title,
+            content=content,
+            author=author,
+            url=url,
+            source_platform=urlparse(url).netloc
+        )
+    
+    @staticmethod
+    def bounded_text(elem) -> str:
+        """Join an element's text, stopping once it is too long to protect anyway.
+        
+        Only non-whitespace characters count toward the cap. They are a lower
+        bound on the length after parse_page collapses whitespace, so text is
+        cut short only when the full text would fail validation too.
+        """
+        parts = []
+        total = 0
+        
+        # Same strings get_text() joins, so text split by inline markup
+        # (e.g. Hel<b>lo</b>) is not broken apart
+        for text in elem.strings:
+            parts.append(text)
+            total += sum(map(len, text.split()))
+            if total > MAX_CONTENT_LENGTH:
+                break
+        
+        return ''.join(parts)
+    
     def extract_ao3_content(self, work_data: Dict) -> str:
         """Extract content from AO3 work data."""
         # Try different possible content fields
@@ -418,13 +731,20 @@ class BulkProtectionTool:
         if not work.title or not work.content:
             return False
         
-        if len(work.content.strip()) < 100:  # Too short
+        length = len(work.content)
+        
+        if length < MIN_CONTENT_LENGTH:  # Too short
             return False
             
-        if len(work.content) > 10 * 1024 * 1024:  # Too long (>10MB)
+        if length > MAX_CONTENT_LENGTH:  # Too long (>10MB)
             return False
         
-        return True
+        # Surrounding whitespace only matters near the minimum; beyond that,
+        # reject blank content without building a stripped copy
+        if length < 10 * MIN_CONTENT_LENGTH:
+            return len(work.content.strip()) >= MIN_CONTENT_LENGTH
+        
+        return not work.content.isspace()
     
     def show_preview(self, works: List[Work]):
         """Show preview of works to be protected."""
@@ -448,43 +768,230 @@ class BulkProtectionTool:
         print(f"\n🔒 {'Simulating' if self.dry_run else 'Protecting'} {len(works)} works...")
         print("-" * 60)
         
-        for i, work in enumerate(works, 1):
-            print(f"[{i}/{len(works)}] {work.title[:50]}...")
+        # Live runs remember confirmed hashes on disk so reruns resume
+        if not self.dry_run and self.ledger is None:
+            try:
+                self.ledger = ProtectionLedger(PROTECTED_DB_PATH, self.api_url)
+                self.seen_hashes.update(self.ledger.hashes())
+            except (OSError, sqlite3.Error) as e:
+                print(f"⚠️ Could not open protection ledger {PROTECTED_DB_PATH}: {e}")
+                print("   Works protected in earlier runs will not be skipped")
+                self.ledger = None
+        
+        works = self.skip_duplicates(works)
+        total = len(works) + sum(len(copies) for copies in self.duplicates.values())
+        
+        try:
+            # The bulk endpoint does not persist or register works on-chain
+            # yet, so it is only used when explicitly requested
+            if not self.dry_run and self.use_bulk and self.bulk_supported and total > 1:
+                works = self.protect_works_bulk(works, license_type, total=total)
+            
+            self.protect_works_individually(works, license_type, total)
+            
+        except KeyboardInterrupt:
+            print("\n⏹️ Protection interrupted by user")
+        finally:
+            if self.ledger is not None:
+                self.ledger.commit()
+    
+    def skip_duplicates(self, works: List[Work]) -> List[Work]:
+        """Drop works that are already protected, and hold back repeats within this run.
+        
+        A repeat is not submitted; it is reported with the outcome of the
+        first work carrying the same content (see record_result).
+        """
+        unique = []
+        self.duplicates = {}
+        
+        for work in works:
+            content_hash = work.content_hash()
+            if content_hash in self.seen_hashes:
+                self.skipped_count += 1
+                print(f"⏭️ Skipping already protected: {work.title[:50]}")
+                continue
+            
+            if content_hash in self.duplicates:
+                self.duplicates[content_hash].append(work)
+                continue
+            
+            self.duplicates[content_hash] = []
+            unique.append(work)
+        
+        return unique
+    
+    def protect_works_individually(self, works: List[Work], license_type: str, total: int):
+        """Protect works one API call each, spread over worker threads."""
+        with ThreadPoolExecutor(max_workers=PROTECT_WORKERS) as executor:
+            futures = {
+                executor.submit(self.protect_one, work, license_type): work
+                for work in works
+            }
             
             try:
-                if self.dry_run:
-                    # Simulate protection
-                    time.sleep(0.1)  # Simulate API call
-                    result = self.simulate_protection(work, license_type)
-                else:
-                    result = self.protect_work(work, license_type)
-                
-                if result['success']:
-                    self.protected_count += 1
-                    print(f"  ✅ Protected: {result.get('content_hash', '')[:16]}...")
-                else:
-                    self.error_count += 1
-                    print(f"  ❌ Failed: {result.get('error', 'Unknown error')}")
-                
-                self.results.append({
-                    'work': work,
-                    'result': result
-                })
-                
-                # Rate limiting
-                time.sleep(0.5)
-                
+                for future in as_completed(futures):
+                    work = futures[future]
+                    
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        result = {'success': False, 'error': f"Exception: {e}"}
+                    
+                    self.record_result(work, result, total)
+                    
             except KeyboardInterrupt:
-                print("\n⏹️ Protection interrupted by user")
-                break
-            except Exception as e:
-                self.error_count += 1
-                print(f"  ❌ Exception: {e}")
+                for future in futures:
+                    future.cancel()
+                raise
+    
+    def protect_works_bulk(self, works: List[Work], license_type: str,
+                           batch_size: int = BULK_BATCH_SIZE, total: Optional[int] = None) -> List[Work]:
+        """Protect works in batches via the bulk endpoint.
+        
+        Returns the works that still need protecting one at a time: all of
+        them when the API has no bulk endpoint, otherwise those too large to
+        send in a bulk request.
+        """
+        total = total or len(works)
+        batches, remaining = self.plan_bulk_batches(works, license_type, batch_size)
+        if not batches:
+            return remaining
+        
+        # Probe with the first batch so a missing endpoint is detected once
+        first_works, first_items = batches[0]
+        try:
+            results = self.protect_batch(first_works, first_items, license_type)
+        except BulkEndpointUnavailable as e:
+            print(f"ℹ️ {e} - protecting works one at a time")
+            self.bulk_supported = False
+            return works
+        except BulkBatchTooLarge as e:
+            print(f"ℹ️ {e} - protecting its works one at a time")
+            remaining.extend(first_works)
+            results = []
+        
+        for work, result in zip(first_works, results):
+            self.record_result(work, result, total)
+        
+        with ThreadPoolExecutor(max_workers=PROTECT_WORKERS) as executor:
+            futures = {
+                executor.submit(self.protect_batch, batch_works, items, license_type): batch_works
+                for batch_works, items in batches[1:]
+            }
+            
+            try:
+                for future in as_completed(futures):
+                    batch = futures[future]
+                    
+                    try:
+                        results = future.result()
+                    except BulkBatchTooLarge as e:
+                        print(f"ℹ️ {e} - protecting its works one at a time")
+                        remaining.extend(batch)
+                        continue
+                    except Exception as e:
+                        results = [{'success': False, 'error': str(e)} for _ in batch]
+                    
+                    for work, result in zip(batch, results):
+                        self.record_result(work, result, total)
+                    
+            except KeyboardInterrupt:
+                for future in futures:
+                    future.cancel()
+                raise
+        
+        return remaining
+    
+    def plan_bulk_batches(self, works: List[Work], license_type: str,
+                          batch_size: int) -> Tuple[List[Tuple[List[Work], List[bytes]]], List[Work]]:
+        """Split works into bulk batches capped by count and serialized size.
+        
+        Each work is serialized once here and sent as-is by protect_batch.
+        Works that would not fit in a request on their own are returned
+        separately, to be protected one at a time.
+        """
+        batches = []
+        oversized = []
+        batch_works: List[Work] = []
+        batch_items: List[bytes] = []
+        batch_bytes = 0
+        
+        for work in works:
+            item = self.build_payload(work, license_type)
+            item['content'] = work.content  # The bulk endpoint hashes server-side
+            encoded = dump_json(item)
+            
+            if len(encoded) > BULK_MAX_BYTES:
+                oversized.append(work)
                 continue
+            
+            # One extra byte per item for the separating comma
+            if batch_works and (len(batch_works) >= batch_size
+                                or batch_bytes + len(encoded) + 1 > BULK_MAX_BYTES):
+                batches.append((batch_works, batch_items))
+                batch_works, batch_items, batch_bytes = [], [], 0
+            
+            batch_works.append(work)
+            batch_items.append(encoded)
+            batch_bytes += len(encoded) + 1
+        
+        if batch_works:
+            batches.append((batch_works, batch_items))
+        
+        return batches, oversized
+    
+    def record_result(self, work: Work, result: Dict[str, Any], total: int):
+        """Tally and report the outcome of protecting one work and its repeats."""
+        content_hash = work.content_hash()
+        self.report_result(work, result, total)
+        
+        for copy in self.duplicates.pop(content_hash, ()):
+            self.report_result(copy, result, total, duplicate_of=work)
+        
+        if result['success']:
+            self.seen_hashes.add(content_hash)
+        
+        # Bulk submissions are not persisted by the API, so they are never
+        # recorded as done and get protected properly on the next run
+        if result['success'] and not result.get('bulk') and self.ledger is not None:
+            # The API reports the transaction as blockchainTx (and blockchain.tx)
+            tx_hash = result.get('blockchainTx') or (result.get('blockchain') or {}).get('tx')
+            self.ledger.add(content_hash, tx_hash)
+    
+    def report_result(self, work: Work, result: Dict[str, Any], total: int,
+                      duplicate_of: Optional[Work] = None):
+        """Count and print one work's outcome and add it to the results."""
+        print(f"[{len(self.results) + 1}/{total}] {work.title[:50]}...")
+        
+        if duplicate_of is not None:
+            print(f"  ↩️ Same content as: {duplicate_of.title[:50]}")
+        
+        if result['success']:
+            self.protected_count += 1
+            print(f"  ✅ Protected: {result.get('content_hash', '')[:16]}...")
+        else:
+            self.error_count += 1
+            print(f"  ❌ Failed: {result.get('error', 'Unknown error')}")
+        
+        self.results.append({
+            'work': work,
+            'result': result
+        })
+    
+    def protect_one(self, work: Work, license_type: str) -> Dict[str, Any]:
+        """Protect a single work from a worker thread."""
+        if self.dry_run:
+            # Simulate protection
+            time.sleep(0.1)  # Simulate API call
+            return self.simulate_protection(work, license_type)
+        
+        # Rate limiting
+        self.rate_limiter.acquire()
+        return self.protect_work(work, license_type)
     
     def simulate_protection(self, work: Work, license_type: str) -> Dict[str, Any]:
         """Simulate protection for dry run."""
-        content_hash = hashlib.sha256(work.content.encode()).hexdigest()
+        content_hash = work.content_hash()
         
         return {
             'success': True,
@@ -494,44 +1001,42 @@ class BulkProtectionTool:
             'simulated': True
         }
     
+    def build_payload(self, work: Work, license_type: str) -> Dict[str, Any]:
+        """Build the protection API payload for a work."""
+        return {
+            'content_hash': f"sha256:{work.content_hash()}",
+            'creator': 'bulk-protection-tool',  # Would be actual creator ID
+            'license': license_type,
+            'platform': work.source_platform or 'bulk-import',
+            'metadata': {
+                'title': work.title,
+                'author': work.author,
+                'word_count': work.word_count,
+                'url': work.url,
+                'published_date': work.published_date,
+                'tags': work.tags,
+                'fandoms': work.fandoms,
+                'characters': work.characters,
+                'original_id': work.original_id
+            }
+        }
+    
     def protect_work(self, work: Work, license_type: str) -> Dict[str, Any]:
         """Actually protect work via DAON API."""
         try:
-            # Generate content hash
-            content_hash = hashlib.sha256(work.content.encode()).hexdigest()
-            
             # Prepare API payload
-            payload = {
-                'content_hash': f"sha256:{content_hash}",
-                'creator': 'bulk-protection-tool',  # Would be actual creator ID
-                'license': license_type,
-                'platform': work.source_platform or 'bulk-import',
-                'metadata': {
-                    'title': work.title,
-                    'author': work.author,
-                    'word_count': work.word_count,
-                    'url': work.url,
-                    'published_date': work.published_date,
-                    'tags': work.tags,
-                    'fandoms': work.fandoms,
-                    'characters': work.characters,
-                    'original_id': work.original_id
-                }
-            }
+            payload = self.build_payload(work, license_type)
             
             # Make API call
-            response = requests.post(
+            response = self.session.post(
                 f"{self.api_url}/api/v1/protect",
-                json=payload,
-                headers={
-                    'Content-Type': 'application/json',
-                    'User-Agent': 'DAON-Bulk-Protection-Tool/1.0'
-                },
-                timeout=30
+                data=dump_json(payload),
+                headers={'Content-Type': 'application/json'},
+                timeout=(PROTECT_CONNECT_TIMEOUT, PROTECT_READ_TIMEOUT)
             )
             
             response.raise_for_status()
-            return response.json()
+            return load_json(response.content)
             
         except Exception as e:
             return {
@@ -539,6 +1044,72 @@ class BulkProtectionTool:
                 'error': str(e)
             }
     
+    def protect_batch(self, works: List[Work], items: List[bytes],
+                      license_type: str) -> List[Dict[str, Any]]:
+        """Protect a batch of works with one bulk API call.
+        
+        `items` holds each work's serialized payload, as built by
+        plan_bulk_batches. Returns one result per work, in order. Raises
+        BulkEndpointUnavailable if the API does not expose the bulk endpoint,
+        and BulkBatchTooLarge if it rejects the request body as too large.
+        """
+        try:
+            body = b''.join((
+                b'{"license":', dump_json(license_type),
+                b',"works":[', b','.join(items), b']}',
+            ))
+            
+            # Rate limiting (one token per request, not per work)
+            self.rate_limiter.acquire()
+            
+            response = self.session.post(
+                f"{self.api_url}/api/v1/protect/bulk",
+                data=body,
+                headers={'Content-Type': 'application/json'},
+                timeout=(PROTECT_CONNECT_TIMEOUT, PROTECT_READ_TIMEOUT)
+            )
+            
+            if response.status_code in (404, 405):
+                raise BulkEndpointUnavailable(f"Bulk endpoint unavailable (HTTP {response.status_code})")
+            if response.status_code == 413:
+                raise BulkBatchTooLarge(f"Bulk request too large ({len(body)} bytes)")
+            
+            response.raise_for_status()
+            data = load_json(response.content)
+            
+        except (BulkEndpointUnavailable, BulkBatchTooLarge):
+            raise
+        except Exception as e:
+            return [{'success': False, 'error': str(e)} for _ in works]
+        
+        # Match response items back to input works by position
+        items = data.get('results') or []
+        results = []
+        
+        for i, work in enumerate(works):
+            if i >= len(items):
+                results.append({'success': False, 'error': 'Missing from bulk response'})
+                continue
+            
+            item = items[i]
+            if item.get('error') or item.get('success') is False:
+                results.append({'success': False, 'error': item.get('error', 'Unknown error')})
+                continue
+            
+            content_hash = item.get('contentHash') or item.get('content_hash') or work.content_hash()
+            if not content_hash.startswith('sha256:'):
+                content_hash = f"sha256:{content_hash}"
+            
+            results.append({
+                'success': True,
+                'content_hash': content_hash,
+                'verification_url': item.get('verificationUrl'),
+                'existing': item.get('existing', False),
+                'bulk': True
+            })
+        
+        return results
+    
     def show_summary(self):
         """Show protection summary."""
         print("\n" + "="*60)
@@ -546,6 +1117,8 @@ class BulkProtectionTool:
         print("="*60)
         print(f"✅ Successfully protected: {self.protected_count}")
         print(f"❌ Failed to protect: {self.error_count}")
+        if self.skipped_count > 0:
+            print(f"⏭️ Skipped (already protected): {self.skipped_count}")
         print(f"📊 Total processed: {len(self.results)}")
         
         if self.error_count > 0:
@@ -558,7 +1131,13 @@ class BulkProtectionTool:
             print(f"\n🧪 This was a DRY RUN - no actual protection occurred")
             print(f"Remove --dry-run flag to actually protect these works")
         else:
-            print(f"\n🎉 Protection complete! Your works are now secured by DAON blockchain.")
+            bulk_count = sum(1 for r in self.results if r['result'].get('bulk'))
+            if bulk_count:
+                print(f"\n⚠️ {bulk_count} works went through the experimental bulk endpoint,")
+                print(f"which does not yet store them durably or register them on the blockchain.")
+                print(f"Rerun without --bulk to protect them permanently.")
+            else:
+                print(f"\n🎉 Protection complete! Your works are now secured by DAON blockchain.")
             print(f"You can verify protection at: https://verify.daon.network")
             print(f"\n💡 Help keep DAON free: https://ko-fi.com/greenfieldoverride")
 
@@ -601,6 +1180,12 @@ Examples:
         help='Test run without actually protecting works'
     )
     
+    parser.add_argument(
+        '--bulk',
+        action='store_true',
+        help='Experimental: submit works via /api/v1/protect/bulk (not yet persisted or registered on-chain by the API)'
+    )
+    
     args = parser.parse_args()
     
     # Validate source exists
@@ -609,7 +1194,7 @@ Examples:
         sys.exit(1)
     
     # Create protection tool
-    tool = BulkProtectionTool(api_url=args.api_url, dry_run=args.dry_run)
+    tool = BulkProtectionTool(api_url=args.api_url, dry_run=args.dry_run, use_bulk=args.bulk)
     
     # Run protection
     tool.protect_from_source(args.source, args.license)
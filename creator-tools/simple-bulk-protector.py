@@ -26,11 +26,250 @@ import os
 import sys
 import time
 import hashlib
-import urllib.request
+import threading
+import http.client
 import urllib.parse
-from pathlib import Path
+from json.encoder import encode_basestring_ascii
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Any
+from typing import Deque, Dict, Iterator, List, Optional, Tuple, Any
+
+try:
+    # Optional speedup for large exports; the standard library is enough
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # Optional streaming parser so huge exports never sit in memory whole
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    # Optional SIMD parser; records are read lazily and only the fields this
+    # tool looks at are turned into Python objects
+    import simdjson
+except ImportError:
+    simdjson = None
+
+
+# Requests per second sent to the protection API
+PROTECT_RATE_PER_SECOND = 5.0
+
+# Protection requests kept in flight at once (one keep-alive connection each)
+PROTECT_CONCURRENCY = 4
+
+# Protection request body; string fields are filled in with json_string()
+# (matches json.dumps output for the same payload dict, byte for byte)
+PROTECT_PAYLOAD_TEMPLATE = (
+    '{{"content_hash": "sha256:{hash}", "creator": "bulk-protection-user", '
+    '"license": {license}, "platform": "bulk-import", '
+    '"metadata": {{"title": {title}, "author": {author}, '
+    '"word_count": {word_count}, "source_file": {source_file}}}}}'
+)
+
+# Keys checked, in order, for a work's content and author in JSON exports
+CONTENT_FIELDS = ('content', 'body', 'text', 'chapters', 'story')
+AUTHOR_FIELDS = ('author', 'authors', 'creator', 'user', 'by')
+
+# Keys copied out of each record when an export is parsed with simdjson
+RECORD_FIELDS = frozenset(('title',) + CONTENT_FIELDS + AUTHOR_FIELDS)
+
+# File types picked up when protecting a directory
+TEXT_EXTENSIONS = ('.txt', '.md', '.rst', '.text')
+
+# Minimum seconds between per-work progress lines on large runs
+PROGRESS_INTERVAL = 0.25
+
+# Inputs smaller than this take the simple paths: text files are hashed by
+# re-encoding their content instead of tracking its byte span, and JSON
+# exports are loaded whole instead of going through ijson/simdjson
+SMALL_FILE_SIZE = 16 * 1024
+
+# JSON exports larger than this are streamed with ijson (when installed)
+# even if simdjson is available, since simdjson reads the whole file into
+# memory before parsing it
+STREAM_JSON_SIZE = 256 * 1024 * 1024
+
+# Characters split at a time when counting words in large works
+WORD_COUNT_CHUNK = 1024 * 1024
+
+
+def json_string(value: Any) -> str:
+    """Encode a value as a JSON literal, taking the C fast path for strings."""
+    if isinstance(value, str):
+        return encode_basestring_ascii(value)
+    return json.dumps(value)
+
+
+def load_json_file(file_path: str) -> Any:
+    """Load a JSON file, using orjson when it is installed."""
+    with open(file_path, 'rb') as f:
+        data = f.read()
+    
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def simdjson_value(value: Any) -> Any:
+    """Convert a lazy simdjson value into plain Python objects."""
+    if isinstance(value, simdjson.Array):
+        return value.as_list()
+    if isinstance(value, simdjson.Object):
+        return value.as_dict()
+    return value
+
+
+def simdjson_record(value: Any) -> Any:
+    """Materialize only the RECORD_FIELDS of a lazy simdjson work record."""
+    if not isinstance(value, simdjson.Object):
+        return simdjson_value(value)
+    # Walk the record's own keys: probing a simdjson object for a missing
+    # key is far slower than iterating it
+    return {key: simdjson_value(item) for key, item in value.items() if key in RECORD_FIELDS}
+
+
+def iter_json_records(file_path: str) -> Iterator[Any]:
+    """Yield work records from a JSON export.
+    
+    Handles a list of works, {"works": [...]}, or a single work object.
+    With simdjson installed, records are read from its lazy document and
+    only the fields in RECORD_FIELDS are copied out; otherwise ijson (when
+    installed) streams records instead of loading the whole file. Exports
+    under SMALL_FILE_SIZE are always loaded whole, and ijson is preferred
+    over simdjson above STREAM_JSON_SIZE.
+    """
+    size = os.path.getsize(file_path)
+    small = size < SMALL_FILE_SIZE
+    stream = ijson is not None and size > STREAM_JSON_SIZE
+    
+    if simdjson is not None and not small and not stream:
+        with open(file_path, 'rb') as f:
+            data = simdjson.Parser().parse(f.read())
+        
+        if isinstance(data, simdjson.Array):
+            records = data
+        elif isinstance(data, simdjson.Object) and 'works' in data:
+            records = data['works']
+            if not isinstance(records, simdjson.Array):
+                records = simdjson_value(records)
+        else:
+            records = [data]
+        
+        for record in records:
+            yield simdjson_record(record)
+        return
+    
+    if ijson is None or small:
+        data = load_json_file(file_path)
+        
+        # Handle different JSON structures
+        if isinstance(data, list):
+            yield from data
+        elif isinstance(data, dict) and 'works' in data:
+            yield from data['works']
+        else:
+            # Treat as single work
+            yield data
+        return
+    
+    with open(file_path, 'rb') as f:
+        first = f.read(1)
+        while first and first.isspace():
+            first = f.read(1)
+        f.seek(0)
+        
+        if first == b'[':
+            yield from ijson.items(f, 'item', use_float=True)
+            return
+        
+        if first == b'{':
+            # Only the presence of the key decides the shape, so an empty
+            # "works" list yields nothing rather than one single work
+            has_works = any(
+                prefix == '' and event == 'map_key' and value == 'works'
+                for prefix, event, value in ijson.parse(f)
+            )
+            f.seek(0)
+            
+            if has_works:
+                yield from ijson.items(f, 'works.item', use_float=True)
+                return
+        
+        # Treat as single work
+        yield from ijson.items(f, '', use_float=True)
+
+
+def dump_json_file(data: Any, file_path: str):
+    """Write data as indented JSON, using orjson when it is installed."""
+    if orjson is not None:
+        with open(file_path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(file_path, 'w') as f:
+            json.dump(data, f, indent=2)
+
+
+def iter_text_files(root: str) -> Iterator[str]:
+    """Yield paths of text files under root, walking it once with os.scandir."""
+    try:
+        with os.scandir(root) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    yield from iter_text_files(entry.path)
+                elif entry.name.lower().endswith(TEXT_EXTENSIONS) and entry.is_file():
+                    yield entry.path
+    except OSError as e:
+        print(f"❌ Error reading {root}: {e}")
+
+
+def count_words(text: str) -> int:
+    """Count words exactly like len(text.split()), without one giant token list.
+    
+    Large texts are split a slice at a time, correcting for words that
+    straddle a slice boundary, so peak memory stays bounded.
+    """
+    if len(text) <= WORD_COUNT_CHUNK:
+        return len(text.split())
+    
+    count = 0
+    in_word = False
+    
+    for start in range(0, len(text), WORD_COUNT_CHUNK):
+        chunk = text[start:start + WORD_COUNT_CHUNK]
+        count += len(chunk.split())
+        
+        if in_word and not chunk[0].isspace():
+            count -= 1  # Same word continues from the previous slice
+        in_word = not chunk[-1].isspace()
+    
+    return count
+
+
+ASCII_WHITESPACE = b' \t\n\r\x0b\x0c'
+
+
+def utf8_strip_span(data: bytes, start: int, end: int) -> Optional[Tuple[int, int]]:
+    """Return the (start, end) of data[start:end] with whitespace stripped.
+    
+    Matches str.strip() on the decoded text, or returns None when the edges
+    hold non-ASCII whitespace that only str.strip() would remove.
+    """
+    while start < end and data[start] in ASCII_WHITESPACE:
+        start += 1
+    while end > start and data[end - 1] in ASCII_WHITESPACE:
+        end -= 1
+    
+    if start < end:
+        first = data[start:start + 4].decode('utf-8', 'ignore')[:1]
+        last = data[max(start, end - 4):end].decode('utf-8', 'ignore')[-1:]
+        if first.isspace() or last.isspace():
+            return None
+    
+    return start, end
 
 
 @dataclass
@@ -41,21 +280,123 @@ class Work:
     author: str = "Unknown"
     word_count: int = 0
     source_file: str = ""
+    source_name: str = ""
+    content_hash: str = ""
     
     def __post_init__(self):
         if self.word_count == 0:
-            self.word_count = len(self.content.split())
+            self.word_count = count_words(self.content)
+        if not self.source_name:
+            self.source_name = os.path.basename(self.source_file)
+    
+    def compute_hash(self) -> str:
+        """SHA-256 hex digest of the content, cached on the work."""
+        if not self.content_hash:
+            self.content_hash = hashlib.sha256(self.content.encode('utf-8')).hexdigest()
+        return self.content_hash
+    
+    def release_content(self):
+        """Drop the content once the work has been protected; metadata stays."""
+        self.content = ''
+
+
+def hash_work(work: Work) -> str:
+    """Hash a work, returning '' instead of raising so a pool can map over works."""
+    try:
+        return work.compute_hash()
+    except Exception:
+        return ''
+
+
+class ApiConnection:
+    """Keep-alive HTTP(S) connection to the DAON API, reopened if the server drops it.
+    
+    Unlike urllib.request.urlopen, http.client does not follow redirects or
+    honour HTTP(S)_PROXY, so --api-url must point straight at the API.
+    """
+    
+    def __init__(self, api_url: str, timeout: float = 30):
+        parsed = urllib.parse.urlsplit(api_url)
+        self.connection_class = (
+            http.client.HTTPSConnection if parsed.scheme == 'https' else http.client.HTTPConnection
+        )
+        self.host = parsed.netloc
+        self.base_path = parsed.path.rstrip('/')
+        self.timeout = timeout
+        self.conn = None
+    
+    def post(self, path: str, body: bytes, headers: Dict[str, str]) -> Tuple[int, str, bytes]:
+        """POST body to path and return (status, reason, response body)."""
+        while True:
+            reused = self.conn is not None
+            if not reused:
+                self.conn = self.connection_class(self.host, timeout=self.timeout)
+            
+            try:
+                self.conn.request('POST', self.base_path + path, body=body, headers=headers)
+                response = self.conn.getresponse()
+                return response.status, response.reason, response.read()
+            except (http.client.BadStatusLine, ConnectionError):
+                # Server closed the idle connection; retry once on a fresh one
+                self.close()
+                if not reused:
+                    raise
+            except BaseException:
+                # Timeouts and other failures leave the connection mid-request,
+                # so it can never be used again
+                self.close()
+                raise
+    
+    def close(self):
+        """Close the underlying connection, if open."""
+        if self.conn is not None:
+            self.conn.close()
+            self.conn = None
+
+
+class RateLimiter:
+    """Thread-safe token bucket allowing `rate` calls per second, with bursts up to `rate`."""
+    
+    def __init__(self, rate: float):
+        self.rate = rate
+        self.capacity = max(1.0, rate)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def acquire(self):
+        """Block until a call is allowed."""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            # Take a token now; a negative balance reserves a future slot
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0
+        
+        if wait:
+            time.sleep(wait)
 
 
 class SimpleBulkProtector:
     """Simple bulk protection tool using only standard library."""
     
-    def __init__(self, api_url: str = "https://api.daon.network", dry_run: bool = False):
+    def __init__(self, api_url: str = "https://api.daon.network", dry_run: bool = False,
+                 profile: bool = False):
         self.api_url = api_url
         self.dry_run = dry_run
+        self.profile = profile
         self.protected_count = 0
         self.error_count = 0
+        self.last_progress = 0.0
         self.results: List[Dict[str, Any]] = []
+        self.local = threading.local()
+        self.connections: List[ApiConnection] = []
+        self.rate_limiter = RateLimiter(PROTECT_RATE_PER_SECOND)
+        self.headers = {
+            'Content-Type': 'application/json',
+            'User-Agent': 'DAON-Simple-Bulk-Protector/1.0'
+        }
     
     def protect_from_source(self, source_path: str, license_type: str = "liberation_v1"):
         """Main entry point."""
@@ -103,71 +444,79 @@ class SimpleBulkProtector:
         print(f"📖 Parsing JSON export: {file_path}")
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            works = []
-            
-            # Handle different JSON structures
-            if isinstance(data, list):
-                work_list = data
-            elif isinstance(data, dict) and 'works' in data:
-                work_list = data['works']
-            else:
-                # Treat as single work
-                work_list = [data]
-            
-            for work_data in work_list:
-                try:
-                    title = work_data.get('title', 'Untitled')
-                    content = self.extract_content(work_data)
-                    author = self.extract_author(work_data)
-                    
-                    if content and len(content.strip()) > 50:
-                        work = Work(
-                            title=title,
-                            content=content,
-                            author=author,
-                            source_file=file_path
-                        )
-                        works.append(work)
-                
-                except Exception as e:
-                    print(f"⚠️ Skipping invalid work: {e}")
-                    continue
-            
-            return works
+            return list(self.iter_json_export(file_path))
             
         except Exception as e:
             print(f"❌ Error parsing JSON: {e}")
             return []
     
+    def iter_json_export(self, file_path: str) -> Iterator[Work]:
+        """Yield works from a JSON export as each record is parsed."""
+        for work_data in iter_json_records(file_path):
+            try:
+                title = work_data.get('title', 'Untitled')
+                content = self.extract_content(work_data)
+                author = self.extract_author(work_data)
+                
+                if content and len(content.strip()) > 50:
+                    yield Work(
+                        title=title,
+                        content=content,
+                        author=author,
+                        source_file=file_path
+                    )
+            
+            except Exception as e:
+                print(f"⚠️ Skipping invalid work: {e}")
+                continue
+    
     def parse_single_file(self, file_path: str) -> Optional[Work]:
         """Parse a single text/markdown file."""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read().strip()
+            with open(file_path, 'rb') as f:
+                raw = f.read()
+            
+            # Fewer bytes than the minimum can never decode to enough characters
+            if len(raw) < 50:
+                print(f"⚠️ Skipping short file: {file_path}")
+                return None
+            
+            if b'\r' in raw:
+                # Match text-mode newline handling; done on the bytes so they
+                # still line up with the decoded content for hashing
+                raw = raw.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+            
+            content = raw.decode('utf-8')
+            span = utf8_strip_span(raw, 0, len(raw)) if len(raw) >= SMALL_FILE_SIZE else None
+            content = content.strip()
             
             if len(content) < 50:
                 print(f"⚠️ Skipping short file: {file_path}")
                 return None
             
-            # Try to extract title from first line
-            lines = content.split('\n')
-            first_line = lines[0].strip()
+            # Try to extract title from first line (sliced, not split into lines)
+            newline = content.find('\n')
+            first_line = (content[:newline] if newline != -1 else content).strip()
             
             if len(first_line) < 100 and not first_line.endswith('.'):
                 # Likely a title
                 title = first_line
-                content = '\n'.join(lines[1:]).strip()
+                content = content[newline + 1:].strip() if newline != -1 else ''
+                
+                if span is not None:
+                    newline = raw.find(b'\n', span[0], span[1])
+                    span = utf8_strip_span(raw, newline + 1, span[1]) if newline != -1 else (0, 0)
             else:
                 # Use filename as title
-                title = Path(file_path).stem
+                title = os.path.splitext(os.path.basename(file_path))[0]
             
             return Work(
                 title=title,
                 content=content,
-                source_file=file_path
+                source_file=file_path,
+                # Large files are hashed from the bytes already read, so only
+                # the digest outlives this call, not a second copy of the text
+                content_hash=hashlib.sha256(memoryview(raw)[span[0]:span[1]]).hexdigest() if span is not None else ''
             )
             
         except Exception as e:
@@ -179,28 +528,23 @@ class SimpleBulkProtector:
         print(f"📁 Parsing directory: {dir_path}")
         
         works = []
-        text_extensions = {'.txt', '.md', '.rst', '.text'}
         
-        for file_path in Path(dir_path).rglob('*'):
-            if file_path.suffix.lower() in text_extensions:
-                work = self.parse_single_file(str(file_path))
-                if work:
-                    works.append(work)
+        for file_path in iter_text_files(dir_path):
+            work = self.parse_single_file(file_path)
+            if work:
+                works.append(work)
         
         return works
     
     def extract_content(self, work_data: dict) -> str:
         """Extract content from work data dictionary."""
         # Try common content fields
-        content_fields = ['content', 'body', 'text', 'chapters', 'story']
-        
-        for field in content_fields:
-            if field in work_data and work_data[field]:
-                content = work_data[field]
-                
+        for key in CONTENT_FIELDS:
+            content = work_data.get(key)
+            if content:
                 if isinstance(content, list):
                     # Join chapters or parts
-                    content = '\n\n'.join(str(part) for part in content)
+                    content = '\n\n'.join(map(str, content))
                 
                 return str(content).strip()
         
@@ -208,14 +552,11 @@ class SimpleBulkProtector:
     
     def extract_author(self, work_data: dict) -> str:
         """Extract author from work data dictionary."""
-        author_fields = ['author', 'authors', 'creator', 'user', 'by']
-        
-        for field in author_fields:
-            if field in work_data and work_data[field]:
-                author = work_data[field]
-                
+        for key in AUTHOR_FIELDS:
+            author = work_data.get(key)
+            if author:
                 if isinstance(author, list):
-                    return ', '.join(str(a) for a in author)
+                    return ', '.join(map(str, author))
                 else:
                     return str(author)
         
@@ -230,7 +571,7 @@ class SimpleBulkProtector:
             print(f"{i}. {work.title}")
             print(f"   Author: {work.author}")
             print(f"   Words: {work.word_count:,}")
-            print(f"   File: {Path(work.source_file).name}")
+            print(f"   File: {work.source_name}")
             print()
         
         if len(works) > 3:
@@ -241,43 +582,149 @@ class SimpleBulkProtector:
         print(f"\n🔒 {'Simulating' if self.dry_run else 'Protecting'} {len(works)} works...")
         print("-" * 50)
         
-        for i, work in enumerate(works, 1):
-            title_preview = work.title[:40] + "..." if len(work.title) > 40 else work.title
-            print(f"[{i}/{len(works)}] {title_preview}")
+        try:
+            # Stage 1 is CPU/memory bound, stage 2 is bound by API latency and
+            # rate limits; each runs on its own pool sized for that
+            # Large files were already hashed while parsing; only count the rest
+            pending = [work for work in works if not work.content_hash] if self.profile else []
             
-            try:
-                if self.dry_run:
-                    result = self.simulate_protection(work, license_type)
-                else:
-                    result = self.protect_work(work, license_type)
+            started = time.perf_counter()
+            digests = self.hash_works(works)
+            hashed = time.perf_counter()
+            
+            if self.profile:
+                hashed_chars = sum(len(work.content) for work in pending)
+                elapsed = max(hashed - started, 1e-9)
+                print(f"⏱️ Hashed {len(pending)} works ({hashed_chars / 1e6:.1f}M chars) in {elapsed:.2f}s "
+                      f"({hashed_chars / 1e6 / elapsed:.1f}M chars/s); "
+                      f"{len(works) - len(pending)} were hashed while parsing")
+            
+            self.submit_works(works, digests, license_type)
+            
+            if self.profile:
+                elapsed = max(time.perf_counter() - hashed, 1e-9)
+                print(f"⏱️ Submitted {len(works)} works in {elapsed:.2f}s "
+                      f"({len(works) / elapsed:.1f} works/s)")
+                    
+        except KeyboardInterrupt:
+            print("\n⏹️ Protection interrupted by user")
+    
+    def hash_works(self, works: List[Work]) -> List[str]:
+        """Hash every work on a thread pool and return the digests in order.
+        
+        hashlib releases the GIL on large buffers, so the pool hashes in
+        parallel. A work that fails to hash gets '' and is hashed again (and
+        reported) when it is submitted.
+        """
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            return list(executor.map(hash_work, works))
+    
+    def submit_works(self, works: List[Work], digests: List[str], license_type: str):
+        """Submit works to the API, PROTECT_CONCURRENCY at a time, reporting in order."""
+        # Content hash -> (position, future) of the first work submitted with it
+        submitted: Dict[str, Tuple[int, Future]] = {}
+        # (position, work, future, duplicate_of) in input order, reported oldest first
+        pending: Deque[Tuple[int, Work, Future, Optional[int]]] = deque()
+        executor = ThreadPoolExecutor(max_workers=PROTECT_CONCURRENCY)
+        
+        try:
+            for i, (work, digest) in enumerate(zip(works, digests), 1):
+                first = submitted.get(digest) if digest else None
                 
-                if result['success']:
-                    self.protected_count += 1
-                    hash_preview = result.get('content_hash', '')[:16] + "..."
-                    print(f"  ✅ Protected: {hash_preview}")
+                if first:
+                    # Same content was already submitted; reuse its result
+                    duplicate_of, future = first
                 else:
-                    self.error_count += 1
-                    print(f"  ❌ Failed: {result.get('error', 'Unknown error')}")
+                    duplicate_of = None
+                    future = executor.submit(self.submit_work, work, license_type)
+                    if digest:
+                        submitted[digest] = (i, future)
                 
-                self.results.append({
-                    'work': work,
-                    'result': result
-                })
+                pending.append((i, work, future, duplicate_of))
                 
-                # Rate limiting
-                time.sleep(0.2)
-                
-            except KeyboardInterrupt:
-                print("\n⏹️ Protection interrupted by user")
-                break
-            except Exception as e:
+                # Report finished works in order; waiting on the oldest once
+                # PROTECT_CONCURRENCY are queued keeps the pool from running ahead
+                while pending and (len(pending) > PROTECT_CONCURRENCY or pending[0][2].done()):
+                    self.report_work(len(works), *pending.popleft())
+            
+            while pending:
+                self.report_work(len(works), *pending.popleft())
+        
+        except KeyboardInterrupt:
+            for _, _, future, _ in pending:
+                future.cancel()
+            raise
+        finally:
+            executor.shutdown(wait=False)
+            for connection in self.connections:
+                connection.close()
+    
+    def submit_work(self, work: Work, license_type: str) -> Dict[str, Any]:
+        """Protect (or simulate protecting) one work; runs on the submit pool."""
+        if self.dry_run:
+            return self.simulate_protection(work, license_type)
+        return self.protect_work(work, license_type)
+    
+    def report_work(self, total: int, i: int, work: Work, future: Future, duplicate_of: Optional[int]):
+        """Print and record the outcome of a submitted work."""
+        title_preview = work.title[:40] + "..." if len(work.title) > 40 else work.title
+        lines = [f"[{i}/{total}] {title_preview}"]
+        
+        if duplicate_of:
+            lines.append(f"  ↩️ Duplicate of #{duplicate_of}, not resubmitted")
+        
+        try:
+            result = future.result()
+            
+            if result['success']:
+                self.protected_count += 1
+                hash_preview = result.get('content_hash', '')[:16] + "..."
+                lines.append(f"  ✅ Protected: {hash_preview}")
+                self.print_progress(lines, i, total)
+            else:
                 self.error_count += 1
-                print(f"  ❌ Exception: {e}")
-                continue
+                lines.append(f"  ❌ Failed: {result.get('error', 'Unknown error')}")
+                self.print_progress(lines, i, total, force=True)
+            
+            # Keep only the metadata; the work's content is released below
+            self.results.append({
+                'title': work.title,
+                'author': work.author,
+                'word_count': work.word_count,
+                'source_file': work.source_file,
+                'result': result
+            })
+            
+        except Exception as e:
+            self.error_count += 1
+            lines.append(f"  ❌ Exception: {e}")
+            self.print_progress(lines, i, total, force=True)
+        finally:
+            work.release_content()
+    
+    def print_progress(self, lines: List[str], i: int, total: int, force: bool = False):
+        """Print a work's progress lines at most every PROGRESS_INTERVAL seconds.
+        
+        The first and last works, each 1% step, and forced (failed) works are
+        always printed.
+        """
+        now = time.monotonic()
+        if (force or i == 1 or i == total or i % max(1, total // 100) == 0
+                or now - self.last_progress >= PROGRESS_INTERVAL):
+            print('\n'.join(lines))
+            self.last_progress = now
+    
+    def get_connection(self) -> ApiConnection:
+        """Keep-alive API connection owned by the calling submit thread."""
+        connection = getattr(self.local, 'connection', None)
+        if connection is None:
+            connection = self.local.connection = ApiConnection(self.api_url)
+            self.connections.append(connection)
+        return connection
     
     def simulate_protection(self, work: Work, license_type: str) -> Dict[str, Any]:
         """Simulate protection for dry run."""
-        content_hash = hashlib.sha256(work.content.encode('utf-8')).hexdigest()
+        content_hash = work.compute_hash()
         
         return {
             'success': True,
@@ -290,37 +737,26 @@ class SimpleBulkProtector:
         """Protect work via DAON API."""
         try:
             # Generate content hash
-            content_hash = hashlib.sha256(work.content.encode('utf-8')).hexdigest()
+            content_hash = work.compute_hash()
             
-            # Prepare payload
-            payload = {
-                'content_hash': f"sha256:{content_hash}",
-                'creator': 'bulk-protection-user',
-                'license': license_type,
-                'platform': 'bulk-import',
-                'metadata': {
-                    'title': work.title,
-                    'author': work.author,
-                    'word_count': work.word_count,
-                    'source_file': work.source_file
-                }
-            }
+            # Prepare payload by filling the pre-built JSON template
+            data = PROTECT_PAYLOAD_TEMPLATE.format(
+                hash=content_hash,
+                license=json_string(license_type),
+                title=json_string(work.title),
+                author=json_string(work.author),
+                word_count=int(work.word_count),
+                source_file=json_string(work.source_file)
+            ).encode('utf-8')
             
-            # Make HTTP request
-            data = json.dumps(payload).encode('utf-8')
+            # Make HTTP request over this thread's keep-alive connection
+            self.rate_limiter.acquire()
+            status, reason, body = self.get_connection().post('/api/v1/protect', data, self.headers)
             
-            req = urllib.request.Request(
-                f"{self.api_url}/api/v1/protect",
-                data=data,
-                headers={
-                    'Content-Type': 'application/json',
-                    'User-Agent': 'DAON-Simple-Bulk-Protector/1.0'
-                }
-            )
+            if status >= 400:
+                raise Exception(f"HTTP Error {status}: {reason}")
             
-            with urllib.request.urlopen(req, timeout=30) as response:
-                result = json.loads(response.read().decode('utf-8'))
-                return result
+            return json.loads(body.decode('utf-8'))
                 
         except Exception as e:
             return {
@@ -341,7 +777,7 @@ class SimpleBulkProtector:
             print(f"\n❌ Errors occurred:")
             for result in self.results[-5:]:  # Show last 5 errors
                 if not result['result']['success']:
-                    title = result['work'].title[:30]
+                    title = result['title'][:30]
                     error = result['result'].get('error', 'Unknown')
                     print(f"  - {title}: {error}")
         
@@ -356,18 +792,7 @@ class SimpleBulkProtector:
         if self.results:
             results_file = f"daon_protection_results_{int(time.time())}.json"
             try:
-                with open(results_file, 'w') as f:
-                    # Convert results to serializable format
-                    serializable_results = []
-                    for r in self.results:
-                        serializable_results.append({
-                            'title': r['work'].title,
-                            'author': r['work'].author,
-                            'word_count': r['work'].word_count,
-                            'source_file': r['work'].source_file,
-                            'result': r['result']
-                        })
-                    json.dump(serializable_results, f, indent=2)
+                dump_json_file(self.results, results_file)
                 print(f"📄 Results saved to: {results_file}")
             except Exception as e:
                 print(f"⚠️ Could not save results: {e}")
@@ -409,13 +834,19 @@ Examples:
         help='Test without actually protecting'
     )
     
+    parser.add_argument(
+        '--profile',
+        action='store_true',
+        help='Print time spent hashing and submitting works'
+    )
+    
     args = parser.parse_args()
     
     if not os.path.exists(args.source):
         print(f"❌ Source not found: {args.source}")
         sys.exit(1)
     
-    tool = SimpleBulkProtector(api_url=args.api_url, dry_run=args.dry_run)
+    tool = SimpleBulkProtector(api_url=args.api_url, dry_run=args.dry_run, profile=args.profile)
     tool.protect_from_source(args.source, args.license)
 
 
@@ -2,7 +2,7 @@
 Data models for DAON SDK
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from typing import Dict, List, Optional, Any, Union
 from datetime import datetime
 from enum import Enum
@@ -55,17 +55,23 @@ class ContentMetadata:
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for API calls."""
         data = {}
-        for key, value in self.__dict__.items():
-            if value is not None:
-                if isinstance(value, datetime):
-                    data[key] = value.isoformat()
-                elif isinstance(value, list) and value:
-                    data[key] = value
-                elif value:
-                    data[key] = value
+        for key, is_date in _CONTENT_METADATA_FIELDS:
+            value = getattr(self, key)
+            if value:
+                if is_date and isinstance(value, datetime):
+                    value = value.isoformat()
+                data[key] = value
         return data
 
 
+# (name, is_date) for each ContentMetadata field, in declaration order;
+# to_dict walks this instead of inspecting every value in __dict__.
+_CONTENT_METADATA_DATE_FIELDS = ("published_at", "updated_at")
+_CONTENT_METADATA_FIELDS = tuple(
+    (f.name, f.name in _CONTENT_METADATA_DATE_FIELDS) for f in fields(ContentMetadata)
+)
+
+
 @dataclass
 class ProtectionRequest:
     """Request to protect content with DAON."""
@@ -5,6 +5,7 @@ Uses requests-mock to intercept HTTP calls so no live server is needed.
 """
 
 import hashlib
+from datetime import datetime
 import pytest
 import requests_mock as requests_mock_module
 
@@ -99,6 +100,25 @@ def test_client_generate_hash_matches_utils():
     assert client.generate_content_hash(HASH_TEST_CONTENT) == generate_content_hash(HASH_TEST_CONTENT)
 
 
+# ---------------------------------------------------------------------------
+# ContentMetadata.to_dict
+# ---------------------------------------------------------------------------
+
+
+def test_metadata_to_dict_skips_empty_fields():
+    metadata = ContentMetadata(title="Work", word_count=0, tags=[], custom={})
+    assert metadata.to_dict() == {"title": "Work"}
+
+
+def test_metadata_to_dict_serializes_dates():
+    published = datetime(2026, 1, 1, 12, 0, 0)
+    metadata = ContentMetadata(published_at=published, updated_at="2026-01-02")
+    assert metadata.to_dict() == {
+        "published_at": published.isoformat(),
+        "updated_at": "2026-01-02",
+    }
+
+
 # ---------------------------------------------------------------------------
 # check_liberation_compliance (pure — no network)
 # ---------------------------------------------------------------------------